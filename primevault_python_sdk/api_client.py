@@ -1,6 +1,10 @@
+import random
+import time
 from typing import List, Optional
+from urllib.parse import urlencode
 
 from primevault_python_sdk.base_api_client import BaseAPIClient
+from primevault_python_sdk.constants import TERMINAL_TRANSACTION_STATUSES
 
 
 class APIClient(BaseAPIClient):
@@ -8,11 +12,45 @@ class APIClient(BaseAPIClient):
         return self.get("/api/external/assets/")
 
     def get_transactions(self, page: Optional[int] = 1, limit: Optional[int] = 20):
-        return self.get(f"/api/external/transactions/?page={page}&limit={limit}")
+        query = urlencode({"page": page, "limit": limit})
+        return self.get(f"/api/external/transactions/?{query}")
 
     def get_transaction_by_id(self, transaction_id: str):
         return self.get(f"/api/external/transactions/{transaction_id}/")
 
+    def wait_for_transaction(
+        self,
+        transaction_id: str,
+        max_attempts: int = 40,
+        initial_delay: float = 0.5,
+        max_delay: float = 5.0,
+    ):
+        """
+        Poll a transaction until it is COMPLETED or FAILED.
+
+        The delay between polls starts at initial_delay seconds and doubles up to
+        max_delay seconds, with a little jitter so concurrent pollers don't line up.
+
+        Returns the transaction once it is terminal, including when it FAILED, so
+        check its "status". Raises TimeoutError after max_attempts polls (about 3
+        minutes with the defaults); raise max_attempts for slower chains.
+        """
+        delay = initial_delay
+        for attempt in range(max_attempts):
+            transaction = self.get_transaction_by_id(transaction_id)
+            if not isinstance(transaction, dict):
+                raise Exception(
+                    f"Unexpected response for transaction {transaction_id}: {transaction}"
+                )
+            if transaction["status"] in TERMINAL_TRANSACTION_STATUSES:
+                return transaction
+            if attempt < max_attempts - 1:
+                time.sleep(delay + random.uniform(0, 0.25))
+                delay = min(max_delay, delay * 2)
+        raise TimeoutError(
+            f"Transaction {transaction_id} did not complete after {max_attempts} attempts"
+        )
+
     def estimate_fee(
         self, source: dict, destination: str, amount: str, asset: str, chain: str
     ):
@@ -100,9 +138,8 @@ class APIClient(BaseAPIClient):
         limit: Optional[int] = 20,
         reverse: Optional[bool] = False,
     ):
-        return self.get(
-            f"/api/external/vaults/?limit={limit}&page={page}&reverse={reverse}"
-        )
+        query = urlencode({"limit": limit, "page": page, "reverse": reverse})
+        return self.get(f"/api/external/vaults/?{query}")
 
     def get_vault_by_id(self, vault_id: str):
         return self.get(f"/api/external/vaults/{vault_id}/")
@@ -134,7 +171,8 @@ class APIClient(BaseAPIClient):
         )
 
     def get_contacts(self, page: Optional[int] = 1, limit: Optional[int] = 20):
-        return self.get(f"/api/external/contacts/?limit={limit}&page={page}")
+        query = urlencode({"limit": limit, "page": page})
+        return self.get(f"/api/external/contacts/?{query}")
 
     def get_contact_by_id(self, contact_id: str):
         return self.get(f"/api/external/contacts/{contact_id}/")
@@ -0,0 +1,77 @@
+import asyncio
+from typing import Optional
+
+import httpx
+
+from primevault_python_sdk.base_api_client import _APIClientCore
+
+
+class AsyncBaseAPIClient(_APIClientCore):
+    """
+    asyncio counterpart of BaseAPIClient, so independent calls can be awaited
+    together, e.g. await asyncio.gather(*[client.get(path) for path in paths]).
+
+    Only the raw get/post are provided; APIClient's endpoint helpers
+    (get_balances, create_transfer_transaction, ...) are sync-only, so callers
+    pass the same /api/external/... paths themselves.
+
+    Requires the "async" extra: pip install "primevault_api_sdk[async]"
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str,
+        private_key_hex: Optional[str] = None,
+        key_id: Optional[str] = None,
+        pool_maxsize: int = 20,
+    ):
+        super().__init__(api_key, api_url, private_key_hex, key_id)
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize
+            ),
+        )
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def get(self, path: str, params: Optional[dict] = None):
+        return await self._make_request("GET", url_path=path, params=params)
+
+    async def post(self, path: str, data: Optional[dict] = None):
+        return await self._make_request("POST", url_path=path, data=data)
+
+    async def _make_request(
+        self,
+        method: str,
+        url_path: Optional[str] = None,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+    ):
+        if method not in ("GET", "POST"):
+            raise Exception(f"Invalid method: {method}")
+
+        # Signing blocks: on AWS_KMS it is a boto3 round trip per signature (two per
+        # POST), so run it in a worker thread to keep the event loop free.
+        full_url = f"{self.api_url}{url_path}"
+        headers, body = await asyncio.to_thread(self._prepare_request, url_path, data)
+
+        try:
+            response = await self.client.request(
+                method, full_url, headers=headers, params=params, content=body
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            self._raise_api_error(e.response.status_code, e, e.response.text)
+        except httpx.RequestError as e:
+            raise Exception(f"Request Exception: {e}")
+
+        return self._parse_response(response)
@@ -18,11 +18,27 @@ class AuthTokenService(object):
     ):
         self.api_key = api_key
         self.signature_service = get_signature_service(private_key_hex, key_id)
+        # The JWT header never changes, so its encoded segment is built once.
+        self._encoded_header = base64.urlsafe_b64encode(
+            json_dumps({"alg": "ES256", "typ": "JWT"}).encode()
+        )
+        # GET requests have no body and all share the hash of "{}".
+        self._empty_body_hash = sha256(json_dumps({}).encode("utf-8")).hexdigest()
 
-    def generate_auth_token(self, url_path: str, body: Optional[dict] = None):
+    def generate_auth_token(
+        self,
+        url_path: str,
+        body: Optional[dict] = None,
+        serialized_body: Optional[bytes] = None,
+    ):
+        """serialized_body, if given, must be json_dumps(body) encoded as UTF-8."""
         timestamp = int(time.time())
-        body = body or {}
-        body = sha256(json_dumps(body).encode("utf-8")).hexdigest()
+        if serialized_body is not None:
+            body = sha256(serialized_body).hexdigest()
+        elif body:
+            body = sha256(json_dumps(body).encode("utf-8")).hexdigest()
+        else:
+            body = self._empty_body_hash
         payload = {
             "iat": timestamp,
             "exp": timestamp + Config.get_expires_in(),
@@ -31,18 +47,15 @@ class AuthTokenService(object):
             "body": body,
             "jti": str(uuid4()),
         }
-        headers = {"alg": "ES256", "typ": "JWT"}
-        encoded_request = self.encode_request(headers, payload)
-        signature = self.sign_request(encoded_request.encode("utf-8"))
-        encoded_signature = base64.urlsafe_b64encode(signature).decode("utf-8")
-        return f"{encoded_request}.{encoded_signature}"
+        encoded_request = self.encode_request(payload)
+        signature = self.sign_request(encoded_request)
+        encoded_signature = base64.urlsafe_b64encode(signature)
+        return (encoded_request + b"." + encoded_signature).decode("utf-8")
 
-    def encode_request(self, headers: dict, payload: dict) -> str:
-        json_header = json_dumps(headers).encode()
+    def encode_request(self, payload: dict) -> bytes:
         json_payload = json_dumps(payload).encode()
-        encoded_header = base64.urlsafe_b64encode(json_header).decode("utf-8")
-        encoded_payload = base64.urlsafe_b64encode(json_payload).decode("utf-8")
-        return f"{encoded_header}.{encoded_payload}"
+        encoded_payload = base64.urlsafe_b64encode(json_payload)
+        return self._encoded_header + b"." + encoded_payload
 
     def sign_request(self, encoded_request: bytes):
         return self.signature_service.sign(encoded_request)
@@ -1,14 +1,18 @@
 import json
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from primevault_python_sdk.auth_token_service import AuthTokenService
-from primevault_python_sdk.signature_service import get_signature_service
 from primevault_python_sdk.utils import json_dumps
 
 
-class BaseAPIClient(object):
+class _APIClientCore(object):
+    """Auth, signing and error mapping shared by the sync and async clients."""
+
     def __init__(
         self,
         api_key: str,
@@ -17,7 +21,8 @@ class BaseAPIClient(object):
         key_id: Optional[str] = None,
     ):
         self.api_key = api_key
-        self.api_url = api_url
+        # Paths always start with "/", so drop a trailing one here once.
+        self.api_url = api_url.rstrip("/")
         self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
@@ -26,7 +31,85 @@ class BaseAPIClient(object):
         self.auth_token_service = AuthTokenService(
             self.api_key, private_key_hex, key_id
         )
-        self.signature_service = get_signature_service(private_key_hex, key_id)
+        self.signature_service = self.auth_token_service.signature_service
+
+    def _prepare_request(
+        self, url_path: str, data: Optional[dict] = None
+    ) -> Tuple[dict, Optional[bytes]]:
+        body = json_dumps(data).encode("utf-8") if data is not None else None
+        api_token = self.auth_token_service.generate_auth_token(
+            url_path, serialized_body=body
+        )
+        # Merged per request so later edits to self.headers are still sent, and a
+        # request-local copy keeps the shared dict free of the per-call token.
+        headers = {**self.headers, "Authorization": f"Bearer {api_token}"}
+        if data:
+            # The signature covers the canonical body, so append it to the
+            # already serialized bytes instead of serializing the data twice.
+            signature_hex = self.signature_service.sign(body).hex()
+            body = body[:-1] + f',"dataSignatureHex":"{signature_hex}"}}'.encode()
+        return headers, body
+
+    def _parse_response(self, response):
+        # Error pages and other non-JSON bodies skip the JSON parse attempt.
+        # Media types are case-insensitive, e.g. "Application/JSON".
+        if "json" not in response.headers.get("Content-Type", "").lower():
+            return response.text
+        try:
+            return response.json()
+        except json.decoder.JSONDecodeError:
+            return response.text
+
+    def _raise_api_error(self, status_code: int, error: Exception, response_text: str):
+        status = _STATUS_TO_EXCEPTION.get(status_code)
+        if status is None:
+            raise Exception(f"HTTP Error: {error} {response_text}")
+        exception_class, reason = status
+        raise exception_class(
+            f"{status_code} {reason}: {error} {response_text}",
+            response_text=response_text,
+        )
+
+
+class BaseAPIClient(_APIClientCore):
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str,
+        private_key_hex: Optional[str] = None,
+        key_id: Optional[str] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+    ):
+        super().__init__(api_key, api_url, private_key_hex, key_id)
+        self.pool_maxsize = pool_maxsize
+        self.session = requests.Session()
+        # Only connection failures are retried: a request that reached the server
+        # may have been processed, and its auth token carries a one-time jti.
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=None,
+                connect=3,
+                read=0,
+                status=0,
+                other=0,
+                redirect=0,
+                backoff_factor=0.2,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def get(self, path: str, params: Optional[dict] = None):
         return self._make_request("GET", url_path=path, params=params)
@@ -34,6 +117,25 @@ class BaseAPIClient(object):
     def post(self, path: str, data: Optional[dict] = None):
         return self._make_request("POST", url_path=path, data=data)
 
+    def batch(self, *calls: Callable, max_workers: Optional[int] = None):
+        """
+        Run independent SDK calls concurrently and return their results in order.
+
+        At most max_workers calls (default: the session's pool_maxsize) run at
+        once, so every worker can keep a pooled connection.
+
+        e.g. assets, vault = api_client.batch(
+            api_client.get_assets_data,
+            lambda: api_client.get_vault_by_id(vault_id),
+        )
+        """
+        if not calls:
+            return []
+        max_workers = min(len(calls), max_workers or self.pool_maxsize)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
     def _make_request(
         self,
         method: str,
@@ -41,67 +143,23 @@ class BaseAPIClient(object):
         params: Optional[dict] = None,
         data: Optional[dict] = None,
     ):
+        if method not in ("GET", "POST"):
+            raise Exception(f"Invalid method: {method}")
+
         full_url = f"{self.api_url}{url_path}"
-        api_token = self.auth_token_service.generate_auth_token(url_path, data)
-        self.headers["Authorization"] = f"Bearer {api_token}"
-        if data:
-            data["dataSignatureHex"] = self.signature_service.sign(
-                json_dumps(data).encode("utf-8")
-            ).hex()
+        headers, body = self._prepare_request(url_path, data)
 
-        response = None
         try:
-            if method == "GET":
-                response = requests.get(full_url, headers=self.headers, params=params)
-            elif method == "POST":
-                response = requests.post(
-                    full_url,
-                    headers=self.headers,
-                    params=params,
-                    json=data,
-                )
-            else:
-                raise Exception(f"Invalid method: {method}")
-
+            response = self.session.request(
+                method, full_url, headers=headers, params=params, data=body
+            )
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
-            if response.status_code == 400:
-                raise BadRequestError(
-                    f"400 Bad Request: {e} {response.text}", response_text=response.text
-                )
-            elif response.status_code == 401:
-                raise UnauthorizedError(
-                    f"401 Unauthorized: {e} {response.text}",
-                    response_text=response.text,
-                )
-            elif response.status_code == 403:
-                raise ForbiddenError(
-                    f"403 Forbidden: {e} {response.text}", response_text=response.text
-                )
-            elif response.status_code == 404:
-                raise NotFoundError(
-                    f"404 Not Found: {e} {response.text}", response_text=response.text
-                )
-            elif response.status_code == 429:
-                raise TooManyRequestsError(
-                    f"429 Too Many Requests: {e} {response.text}",
-                    response_text=response.text,
-                )
-
-            elif response.status_code == 500:
-                raise InternalServerError(
-                    f"500 Internal Server Error: {e} {response.text}",
-                    response_text=response.text,
-                )
-            else:
-                raise Exception(f"HTTP Error: {e} {response.text}")
+            self._raise_api_error(response.status_code, e, response.text)
         except requests.exceptions.RequestException as e:
-            raise Exception(f"Request Exception: {e} {response.text}")
+            raise Exception(f"Request Exception: {e}")
 
-        try:
-            return response.json()
-        except json.decoder.JSONDecodeError:
-            return response.text
+        return self._parse_response(response)
 
 
 class BaseAPIException(Exception):
@@ -136,3 +194,14 @@ class ServiceUnavailableError(BaseAPIException):
 
 class TooManyRequestsError(BaseAPIException):
     pass
+
+
+_STATUS_TO_EXCEPTION = {
+    400: (BadRequestError, "Bad Request"),
+    401: (UnauthorizedError, "Unauthorized"),
+    403: (ForbiddenError, "Forbidden"),
+    404: (NotFoundError, "Not Found"),
+    429: (TooManyRequestsError, "Too Many Requests"),
+    500: (InternalServerError, "Internal Server Error"),
+    503: (ServiceUnavailableError, "Service Unavailable"),
+}
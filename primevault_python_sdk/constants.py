@@ -0,0 +1 @@
+TERMINAL_TRANSACTION_STATUSES = frozenset({"COMPLETED", "FAILED"})
@@ -1,7 +1,7 @@
+import functools
 from enum import Enum
 from typing import Optional
 
-import boto3
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
@@ -32,23 +32,44 @@ class PrivateKeySignatureService(BaseSignatureService):
                 private_key_bytes, password=None, backend=default_backend()
             )
         )
+        self.signature_algorithm = ec.ECDSA(hashes.SHA256())
 
     def sign(self, message: bytes):
-        return self.private_key.sign(message, ec.ECDSA(hashes.SHA256()))
+        return self.private_key.sign(message, self.signature_algorithm)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_kms_client(region_name: str):
+    # One client per region is shared by every KMSSignatureService so its
+    # connection pool stays warm; boto3 clients are thread-safe.
+    # boto3 is slow to import and only needed on the AWS_KMS path.
+    import boto3
+    from botocore.config import Config as BotoConfig
+
+    return boto3.client(
+        "kms",
+        region_name=region_name,
+        config=BotoConfig(
+            max_pool_connections=50,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+            tcp_keepalive=True,
+        ),
+    )
 
 
 class KMSSignatureService(BaseSignatureService):
     def __init__(self, key_id: str):
-        self.kms_client = boto3.client("kms", region_name=Config.get_aws_region())
+        self.kms_client = _get_kms_client(Config.get_aws_region())
         self.key_id = key_id
+        self.signing_algorithm = Config.get_kms_signing_algorithm()
+        self._sign_params = {
+            "KeyId": self.key_id,
+            "MessageType": "RAW",
+            "SigningAlgorithm": self.signing_algorithm,
+        }
 
     def sign(self, message: bytes):
-        response = self.kms_client.sign(
-            KeyId=self.key_id,
-            Message=message,
-            MessageType="RAW",
-            SigningAlgorithm=Config.get_kms_signing_algorithm(),
-        )
+        response = self.kms_client.sign(Message=message, **self._sign_params)
         return response["Signature"]
 
 
@@ -1,15 +1,24 @@
+import functools
 import json
 from typing import Optional
 
-import boto3
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 
 from primevault_python_sdk.config import Config
 
+_CURVE = ec.SECP256R1()
+
+
+@functools.lru_cache(maxsize=None)
+def _kms_client(region_name: str):
+    import boto3
+
+    return boto3.client("kms", region_name)
+
 
 def generate_public_private_key_pair() -> (str, str):
-    private_key = ec.generate_private_key(ec.SECP256R1())
+    private_key = ec.generate_private_key(_CURVE)
     public_key = private_key.public_key()
 
     public_key_der = public_key.public_bytes(
@@ -31,7 +40,7 @@ def generate_aws_kms_key_pair(key_alias: Optional[str] = None) -> (str, str):
     """
     Setup AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY in your environment
     """
-    kms_client = boto3.client("kms", Config.get_aws_region())
+    kms_client = _kms_client(Config.get_aws_region())
     key_alias = key_alias or "primevault-access-key"
     response = kms_client.create_key(
         Description="Key for Signing PrimeVault requests",
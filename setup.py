@@ -9,6 +9,9 @@ setup(
         "cryptography==43.0.1",
         "requests==2.32.0",
     ],
+    extras_require={
+        "async": ["httpx[http2]==0.27.2"],
+    },
     author="PrimeVault",
     description="Python SDK for PrimeVault APIs",
     url="https://github.com/horcrux01/primevault_api_sdk",